@@ -1,10 +1,39 @@
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
 from flask import Flask
 from app.config import Config
 
+
+def configure_logging():
+    root_logger = logging.getLogger()
+    # Same contract as logging.basicConfig: leave an already configured root logger alone
+    if root_logger.handlers:
+        return
+
+    # Request and sync threads only enqueue records; a listener thread does the writes
+    log_queue = SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(logging.INFO)
+
+
+def precompile_templates(app):
+    # Parse every template up front so the first request to each page renders from Jinja's cache
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
+
+
 def create_app(test_config=None):
-    logging.basicConfig(level=logging.INFO)
-    
+    configure_logging()
+
     app = Flask(__name__, instance_relative_config=True)
     if test_config is None:
         app.config.from_object(Config)
@@ -32,6 +61,9 @@ def create_app(test_config=None):
     app.register_blueprint(auth_bp, url_prefix="/auth")
     app.register_blueprint(settings_bp, url_prefix="/settings")
 
+    if app.config.get("PRECOMPILE_TEMPLATES"):
+        precompile_templates(app)
+
     # Skip scheduler setup when testing
     if app.config["TESTING"]:
         return app
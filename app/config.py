@@ -10,3 +10,4 @@ class Config:
     ) or "sqlite:///" + os.path.join(basedir, "app.db")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     LOCAL_URL = os.environ.get("POT_SYNC_LOCAL_URL") or "http://localhost:1337"
+    PRECOMPILE_TEMPLATES = (os.environ.get("PRECOMPILE_TEMPLATES") or "True").lower() in ("true", "1", "yes")
@@ -294,6 +294,8 @@ def sync_balance():
             live_card_balance = credit_account.get_total_balance(force_refresh=True)
             current_pot = monzo_account.get_pot_balance(credit_account.pot_id)
             stable_pot = credit_account.stable_pot_balance if credit_account.stable_pot_balance is not None else 0
+            # Read the clock once so the status log, override and standard branches agree on the cooldown state
+            now = int(time())
 
             # Log current account and pot status details
             log.info(
@@ -306,7 +308,7 @@ def sync_balance():
             )
             if credit_account.cooldown_until:
                 hr_cooldown = datetime.datetime.fromtimestamp(credit_account.cooldown_until).strftime("%Y-%m-%d %H:%M:%S")
-                if int(time()) < credit_account.cooldown_until:
+                if now < credit_account.cooldown_until:
                     log.info(f"Cooldown active until {hr_cooldown} (epoch: {credit_account.cooldown_until}).")
                 else:
                     log.info(f"Cooldown expired at {hr_cooldown} (epoch: {credit_account.cooldown_until}).")
@@ -329,7 +331,7 @@ def sync_balance():
                 )
 
             # (a) OVERRIDE BRANCH
-            if override_cooldown_spending and (credit_account.cooldown_until is not None and int(time()) < credit_account.cooldown_until):
+            if override_cooldown_spending and (credit_account.cooldown_until is not None and now < credit_account.cooldown_until):
                 log.info("Step: OVERRIDE branch activated due to cooldown flag.")
                 selection = monzo_account.get_account_type(credit_account.pot_id)
                 # Calculate deposit as the additional spending since the previous baseline.
@@ -359,7 +361,7 @@ def sync_balance():
                 log.info(f"Step: Finished OVERRIDE branch for account '{credit_account.type}'.")
 
             # (b) STANDARD ADJUSTMENT:
-            if credit_account.cooldown_until is None or int(time()) > credit_account.cooldown_until:
+            if credit_account.cooldown_until is None or now > credit_account.cooldown_until:
                 if live_card_balance < current_pot:
                     log.info("Step: Withdrawal due to pot exceeding card balance.")
                     diff = current_pot - live_card_balance
@@ -1,14 +1,28 @@
 import logging
 import math
 import datetime  # Needed for human-readable time conversions
+from functools import cache
 from time import time
 from urllib import parse
 
-import requests as r
+from app.domain.auth_providers import (
+    AuthProviderType,
+    TrueLayerAuthProvider,
+    provider_mapping,
+)
 from app.errors import AuthException
+from app.extensions import http_session
 
 log = logging.getLogger("account")
 
+# Card provider (lowercased account type) -> icon; anything else uses the TrueLayer icon
+PROVIDER_ICONS = {
+    "american express": "amex.svg",
+    "barclaycard": "barclaycard.svg",
+    "halifax": "halifax.svg",
+    "natwest": "natwest.svg",
+}
+
 
 class Account:
     def __init__(
@@ -105,24 +119,29 @@ class MonzoAccount(Account):
             account_id=account_id,
             prev_balance=prev_balance
         )
-        # Initialize the auth provider for Monzo
-        from app.domain.auth_providers import MonzoAuthProvider
-        self.auth_provider = MonzoAuthProvider()
+        # Share the registered Monzo auth provider rather than building one per account
+        self.auth_provider = provider_mapping[AuthProviderType.MONZO]
+        self._open_accounts = None
 
     def ping(self) -> None:
-        r.get(
+        http_session.get(
             f"{self.auth_provider.api_url}/ping/whoami", headers=self.get_auth_header()
         )
 
     def _fetch_accounts(self) -> list:
-        response = r.get(
+        # The account list is stable for the lifetime of this object (one page render or
+        # sync run), so fetch it once instead of on every account ID lookup
+        if self._open_accounts is not None:
+            return self._open_accounts
+
+        response = http_session.get(
             f"{self.auth_provider.api_url}/accounts", headers=self.get_auth_header()
         )
         response.raise_for_status()
         accounts = response.json()["accounts"]
         # Filter out closed accounts
-        open_accounts = [account for account in accounts if not account.get("closed", False)]
-        return open_accounts
+        self._open_accounts = [account for account in accounts if not account.get("closed", False)]
+        return self._open_accounts
 
     def get_authorized_accounts(self) -> list:
         """Return a list of authorized accounts (both personal and joint) with details."""
@@ -164,7 +183,7 @@ class MonzoAccount(Account):
         """
         account_id = self.get_account_id(account_selection=account_selection)
         query = parse.urlencode({"account_id": account_id})
-        response = r.get(
+        response = http_session.get(
             f"{self.auth_provider.api_url}/balance?{query}",
             headers=self.get_auth_header(),
         )
@@ -178,7 +197,7 @@ class MonzoAccount(Account):
         """
         current_account_id = self.get_account_id(account_selection)
         query = parse.urlencode({"current_account_id": current_account_id})
-        response = r.get(
+        response = http_session.get(
             f"{self.auth_provider.api_url}/pots?{query}", headers=self.get_auth_header()
         )
         response.raise_for_status()
@@ -203,9 +222,8 @@ class MonzoAccount(Account):
             # If using the default value, fall back to the first returned pot's id.
             if pot_id == "default_pot" and pots:
                 pot_id = pots[0]["id"]
-            for pot in pots:
-                if any(p["id"] == pot_id for p in pots):
-                    return account_selection
+            if any(p["id"] == pot_id for p in pots):
+                return account_selection
         raise Exception(f"Pot with id {pot_id} not found in personal, joint, or business pots.")
 
     def add_to_pot(self, pot_id: str, amount: int, account_selection="personal") -> None:
@@ -218,19 +236,13 @@ class MonzoAccount(Account):
         pot = next((p for p in pots if p["id"] == pot_id), None)
         if not pot:
             raise Exception(f"Pot with id {pot_id} not found in {account_selection} pots")
-            
-        # Re-fetch pot list for extra safety
-        pots = self.get_pots(account_selection=account_selection)
-        pot = next((p for p in pots if p["id"] == pot_id), None)
-        if pot is None:
-            raise Exception(f"Pot with id {pot_id} not found in {account_selection} pots")
     
         data = {
             "source_account_id": self.get_account_id(account_selection=account_selection),
             "amount": amount,
             "dedupe_id": str(int(time())),  # Ensure dedupe_id is a string
         }
-        response = r.put(
+        response = http_session.put(
             f"{self.auth_provider.api_url}/pots/{pot_id}/deposit",
             data=data,
             headers=self.get_auth_header(),
@@ -249,19 +261,13 @@ class MonzoAccount(Account):
         pot = next((p for p in pots if p["id"] == pot_id), None)
         if not pot:
             raise Exception(f"Pot with id {pot_id} not found in {account_selection} pots")
-        
-        # Re-fetch pot list for extra safety
-        pots = self.get_pots(account_selection=account_selection)
-        pot = next((p for p in pots if p["id"] == pot_id), None)
-        if pot is None:
-            raise Exception(f"Pot with id {pot_id} not found in {account_selection} pots")
     
         data = {
             "destination_account_id": self.get_account_id(account_selection=account_selection),
             "amount": amount,
             "dedupe_id": str(int(time())),  # Ensure dedupe_id is a string
         }
-        response = r.put(
+        response = http_session.put(
             f"{self.auth_provider.api_url}/pots/{pot_id}/withdraw",
             data=data,
             headers=self.get_auth_header(),
@@ -278,13 +284,23 @@ class MonzoAccount(Account):
             "params[title]": title,
             "params[body]": message,
         }
-        r.post(
+        http_session.post(
             f"{self.auth_provider.api_url}/feed",
             data=body,
             headers=self.get_auth_header(),
         )
 
 
+@cache
+def get_truelayer_provider(icon_name):
+    # Providers hold no per-account state, so one instance per icon is shared by all accounts
+    return TrueLayerAuthProvider(
+        name="TrueLayer",
+        type="truelayer",
+        icon_name=icon_name
+    )
+
+
 class TrueLayerAccount(Account):
     def __init__(
         self,
@@ -313,59 +329,45 @@ class TrueLayerAccount(Account):
             cooldown_ref_card_balance=cooldown_ref_card_balance,
             cooldown_ref_pot_balance=cooldown_ref_pot_balance
         )
-        from app.domain.auth_providers import TrueLayerAuthProvider
-        if account_type.lower() == "american express":
-            icon = "amex.svg"
-        elif account_type.lower() == "barclaycard":
-            icon = "barclaycard.svg"
-        elif account_type.lower() == "halifax":
-            icon = "halifax.svg"
-        elif account_type.lower() == "natwest":
-            icon = "natwest.svg"
-        else:
-            icon = "truelayer.svg"
-        self.auth_provider = TrueLayerAuthProvider(
-            name="TrueLayer",
-            type="truelayer",
-            icon_name=icon
-        )
+        icon = PROVIDER_ICONS.get(account_type.lower(), "truelayer.svg")
+        self.auth_provider = get_truelayer_provider(icon)
 
     def ping(self) -> None:
-        r.get(f"{self.auth_provider.api_url}/data/v1/me", headers=self.get_auth_header())
+        http_session.get(f"{self.auth_provider.api_url}/data/v1/me", headers=self.get_auth_header())
 
     def get_cards(self) -> list:
-        response = r.get(f"{self.auth_provider.api_url}/data/v1/cards", headers=self.get_auth_header())
+        response = http_session.get(f"{self.auth_provider.api_url}/data/v1/cards", headers=self.get_auth_header())
         response.raise_for_status()
         return response.json()["results"]
 
     def get_card_balance(self, card_id: str) -> float:
-        response = r.get(f"{self.auth_provider.api_url}/data/v1/cards/{card_id}/balance", headers=self.get_auth_header())
+        response = http_session.get(f"{self.auth_provider.api_url}/data/v1/cards/{card_id}/balance", headers=self.get_auth_header())
         response.raise_for_status()
         data = response.json()["results"][0]
         # Multiply by 100, round up, then divide by 100 to get two decimal places
         return math.ceil(data["current"] * 100) / 100
 
     def get_pending_transactions(self, card_id: str) -> list:
-        response = r.get(f"{self.auth_provider.api_url}/data/v1/cards/{card_id}/transactions/pending", headers=self.get_auth_header())
+        response = http_session.get(f"{self.auth_provider.api_url}/data/v1/cards/{card_id}/transactions/pending", headers=self.get_auth_header())
         response.raise_for_status()
         transactions = response.json()["results"]
         # Multiply by 100, round up, then divide by 100 to get two decimal places
         return [math.ceil(txn["amount"] * 100) / 100 for txn in transactions] if transactions else []
 
     def get_total_balance(self, force_refresh=False) -> int:
-        total_balance = 0.0
-        cards = self.get_cards()
-
-        # If we have a cached balance and not forcing a refresh, return it:
+        # If we have a cached balance and not forcing a refresh, return it before any API call
         if not force_refresh and hasattr(self, "_cached_balance"):
             return self._cached_balance
 
+        total_balance = 0.0
+        cards = self.get_cards()
+
         for card in cards:
             card_id = card["account_id"]
             provider = card.get("provider", {}).get("display_name")
 
             # Fetch balance data once for all providers
-            balance_response = r.get(f"{self.auth_provider.api_url}/data/v1/cards/{card_id}/balance", headers=self.get_auth_header())
+            balance_response = http_session.get(f"{self.auth_provider.api_url}/data/v1/cards/{card_id}/balance", headers=self.get_auth_header())
             balance_response.raise_for_status()
             balance_data = balance_response.json()["results"][0]
             
@@ -8,7 +8,7 @@ import requests as r
 from app.config import Config
 from app.domain.settings import SettingsPrefix
 from app.errors import AuthException
-from app.extensions import db
+from app.extensions import db, http_session
 from app.models.setting_repository import SqlAlchemySettingRepository
 
 log = logging.getLogger("auth_providers")
@@ -87,7 +87,7 @@ class AuthProvider:
                 f"Received OAuth callback for {self.type}, exchanging for access token"
             )
             body = self.get_oauth_token_request_body(code)
-            response = r.post(self.get_token_url(), data=body)
+            response = http_session.post(self.get_token_url(), data=body)
             return response.json()
         except (KeyError, r.exceptions.JSONDecodeError):
             log.error(
@@ -107,7 +107,7 @@ class AuthProvider:
         try:
             log.info(f"Refreshing tokens for {self.type}")
             body = self.get_refresh_request_body(refresh_token)
-            response = r.post(f"{self.token_url}{self.token_endpoint}", data=body)
+            response = http_session.post(f"{self.token_url}{self.token_endpoint}", data=body)
             return response.json()
         except (KeyError, r.exceptions.JSONDecodeError):
             log.error(
@@ -1,5 +1,9 @@
+import requests
 from flask_apscheduler import APScheduler
 from flask_sqlalchemy import SQLAlchemy
 
 db = SQLAlchemy()
 scheduler = APScheduler()
+
+# Shared by every Monzo/TrueLayer API call so connections are pooled and kept alive
+http_session = requests.Session()
@@ -7,7 +7,7 @@ class AccountModel(db.Model):
     access_token = Column(String(255), nullable=False)
     refresh_token = Column(String(255), nullable=False)
     token_expiry = Column(Integer)
-    pot_id = Column(String(255))
+    pot_id = Column(String(255), index=True)
     account_id = Column(String(255))
     cooldown_until = Column(Integer, nullable=True)
     prev_balance = Column(Integer, default=0)
@@ -44,11 +44,8 @@ class SqlAlchemyAccountRepository:
         results: list[AccountModel] = self._session.query(AccountModel).all()
         return list(map(self._to_domain, results))
 
-    def get_monzo_account(self) -> MonzoAccount:
-        result: AccountModel = (
-            self._session.query(AccountModel).filter_by(type="Monzo").one()
-        )
-        account = self._to_domain(result)
+    def _to_monzo_account(self, model: AccountModel) -> MonzoAccount:
+        account = self._to_domain(model)
         return MonzoAccount(
             account.access_token,
             account.refresh_token,
@@ -58,25 +55,43 @@ class SqlAlchemyAccountRepository:
             prev_balance=account.prev_balance
         )
 
+    def _to_credit_account(self, model: AccountModel) -> TrueLayerAccount:
+        account = self._to_domain(model)
+        return TrueLayerAccount(
+            account.type,
+            account.access_token,
+            account.refresh_token,
+            account.token_expiry,
+            account.pot_id,
+            prev_balance=account.prev_balance,
+            stable_pot_balance=account.stable_pot_balance
+        )
+
+    def get_monzo_account(self) -> MonzoAccount:
+        result: AccountModel = (
+            self._session.query(AccountModel).filter_by(type="Monzo").one()
+        )
+        return self._to_monzo_account(result)
+
     def get_credit_accounts(self) -> list[TrueLayerAccount]:
         results: list[AccountModel] = (
             self._session.query(AccountModel)
             .filter(not_(AccountModel.type.contains("Monzo")))
             .all()
         )
-        accounts = list(map(self._to_domain, results))
-        return [
-            TrueLayerAccount(
-                a.type,
-                a.access_token,
-                a.refresh_token,
-                a.token_expiry,
-                a.pot_id,
-                prev_balance=a.prev_balance,
-                stable_pot_balance=a.stable_pot_balance
-            )
-            for a in accounts
-        ]
+        return list(map(self._to_credit_account, results))
+
+    def get_linked_accounts(self) -> tuple[MonzoAccount | None, list[TrueLayerAccount]]:
+        # Single round trip for pages that show the Monzo account alongside the credit cards
+        results: list[AccountModel] = self._session.query(AccountModel).all()
+        monzo_account = None
+        credit_accounts = []
+        for result in results:
+            if result.type == "Monzo":
+                monzo_account = self._to_monzo_account(result)
+            elif "Monzo" not in result.type:
+                credit_accounts.append(self._to_credit_account(result))
+        return monzo_account, credit_accounts
 
     def get(self, type: str) -> Account:
         result: AccountModel = (
@@ -116,6 +131,18 @@ class SqlAlchemyAccountRepository:
         self._session.query(AccountModel).filter_by(type=type).delete()
         self._session.commit()
 
+    def clear_cooldowns(self, baselines: dict[str, int]) -> None:
+        # Reset every listed account in a single transaction
+        records: list[AccountModel] = (
+            self._session.query(AccountModel)
+            .filter(AccountModel.type.in_(baselines))
+            .all()
+        )
+        for record in records:
+            record.prev_balance = baselines[record.type]
+            record.cooldown_until = None
+        self._session.commit()
+
     def update_credit_account_fields(self, account_type: str, pot_id: str, 
                                      new_balance: int, cooldown_until: int = None) -> Account:
         record: AccountModel = self._session.query(AccountModel).filter_by(type=account_type).one()
@@ -1,4 +1,5 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.exc import NoResultFound
 from app.domain.settings import Setting
 from app.models.setting import SettingModel
 
@@ -20,12 +21,19 @@ class SqlAlchemySettingRepository:
         return list(map(self._to_domain, results))
 
     def get(self, key: str) -> Setting:
-        result: SettingModel = (
-            self._session.query(SettingModel).filter_by(key=key).one()
-        )
+        # key is the primary key, so Session.get can answer from the identity map
+        result: SettingModel | None = self._session.get(SettingModel, key)
+        if result is None:
+            raise NoResultFound(f"Setting '{key}' not found.")
         return self._to_domain(result).value
 
     def save(self, setting: Setting) -> None:
         model = self._to_model(setting)
         self._session.merge(model)
         self._session.commit()
+
+    def save_all(self, settings: list[Setting]) -> None:
+        # Merge every setting and commit once rather than one transaction per setting
+        for setting in settings:
+            self._session.merge(self._to_model(setting))
+        self._session.commit()
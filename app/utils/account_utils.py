@@ -2,12 +2,30 @@ import datetime
 import time
 from app.models.account import AccountModel
 
-def get_cooldown_for_pot(pot_id: str, session) -> str:
+def get_cooldowns_for_pots(pot_ids: list[str], session, now: int = None) -> dict[str, str]:
     """
-    Look up the account with the given pot_id and return the active cooldown
-    formatted as 'YYYY-MM-DD HH:mm:ss'. Returns None if no active cooldown.
+    Look up the accounts linked to the given pots in a single query and return a
+    mapping of pot ID to active cooldown formatted as 'YYYY-MM-DD HH:mm:ss'.
+    Pots without an active cooldown are omitted. Pass `now` to compare against a
+    timestamp the caller already holds.
     """
-    account = session.query(AccountModel).filter_by(pot_id=pot_id).first()
-    if account and account.cooldown_until and account.cooldown_until > int(time.time()):
-        return datetime.datetime.fromtimestamp(account.cooldown_until).strftime("%Y-%m-%d %H:%M:%S")
-    return None
+    if not pot_ids:
+        return {}
+    if now is None:
+        now = int(time.time())
+    # Only the pot and cooldown columns are needed, so skip hydrating full account rows
+    rows = (
+        session.query(AccountModel.pot_id, AccountModel.cooldown_until)
+        .filter(AccountModel.pot_id.in_(pot_ids))
+        .order_by(AccountModel.id)
+        .all()
+    )
+    # As with a per-pot .first(), the first account linked to a pot decides its cooldown
+    cooldowns = {}
+    for pot_id, cooldown_until in rows:
+        cooldowns.setdefault(pot_id, cooldown_until)
+    return {
+        pot_id: datetime.datetime.fromtimestamp(cooldown_until).strftime("%Y-%m-%d %H:%M:%S")
+        for pot_id, cooldown_until in cooldowns.items()
+        if cooldown_until and cooldown_until > now
+    }
@@ -12,13 +12,10 @@ account_repository = SqlAlchemyAccountRepository(db)
 
 @accounts_bp.route("/", methods=["GET"])
 def index():
-    # fetch separately so we can always place Monzo first in the list
-    accounts = account_repository.get_credit_accounts()
-    try:
-        monzo_account = account_repository.get_monzo_account()
+    # Monzo is returned separately so we can always place it first in the list
+    monzo_account, accounts = account_repository.get_linked_accounts()
+    if monzo_account is not None:
         accounts.insert(0, monzo_account)
-    except NoResultFound:
-        pass
 
     return render_template("accounts/index.html", accounts=accounts)
 
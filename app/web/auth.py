@@ -3,11 +3,7 @@ from time import time
 from flask import Blueprint, flash, redirect, request, url_for
 
 from app.domain.accounts import MonzoAccount, TrueLayerAccount
-from app.domain.auth_providers import (
-    AuthProviderType,
-    MonzoAuthProvider,
-    provider_mapping,
-)
+from app.domain.auth_providers import AuthProviderType, provider_mapping
 from app.extensions import db
 from app.models.account_repository import SqlAlchemyAccountRepository
 
@@ -19,7 +15,7 @@ account_repository = SqlAlchemyAccountRepository(db)
 @auth_bp.route("/callback/monzo", methods=["GET"])
 def monzo_callback():
     code = request.args.get("code")
-    tokens = MonzoAuthProvider().handle_oauth_code_callback(code)
+    tokens = provider_mapping[AuthProviderType.MONZO].handle_oauth_code_callback(code)
 
     account = MonzoAccount(
         tokens["access_token"],
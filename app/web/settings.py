@@ -11,6 +11,8 @@ log = logging.getLogger("settings")
 repository = SqlAlchemySettingRepository(db)
 account_repository = SqlAlchemyAccountRepository(db)
 
+CHECKBOX_SETTINGS = frozenset({"enable_sync", "override_cooldown_spending"})
+
 @settings_bp.route("/", methods=["GET"])
 def index():
     settings = {s.key: s.value for s in repository.get_all()}
@@ -23,26 +25,21 @@ def save():
         current_settings = {s.key: s.value for s in repository.get_all()}
 
         # Checkbox: POST request omits unchecked boxes, so set value accordingly
-        if request.form.get("enable_sync") is not None:
-            repository.save(Setting("enable_sync", "True"))
-        else:
-            repository.save(Setting("enable_sync", "False"))
-
-        # Checkbox: POST request omits unchecked boxes, so set value accordingly
-        if request.form.get("override_cooldown_spending") is not None:
-            repository.save(Setting("override_cooldown_spending", "True"))
-        else:
-            repository.save(Setting("override_cooldown_spending", "False"))
+        changed = [Setting(key, str(request.form.get(key) is not None)) for key in CHECKBOX_SETTINGS]
 
         for key, val in request.form.items():
-            if key in ["enable_sync", "override_cooldown_spending"]:
+            if key in CHECKBOX_SETTINGS:
                 continue
 
             if current_settings.get(key) != val:
-                repository.save(Setting(key, val))
+                changed.append(Setting(key, val))
+
+        # Persist everything in one transaction before touching the scheduler
+        repository.save_all(changed)
 
-                if key == "sync_interval_seconds":
-                    scheduler.modify_job(id="sync_balance", trigger="interval", seconds=int(val))
+        for setting in changed:
+            if setting.key == "sync_interval_seconds":
+                scheduler.modify_job(id="sync_balance", trigger="interval", seconds=int(setting.value))
 
         flash("Settings saved")
     except Exception as e:
@@ -63,11 +60,11 @@ def clear_cooldown():
         ]
     else:
         credit_accounts = account_repository.get_credit_accounts()
-    for account in credit_accounts:
-        account.cooldown_until = None
-        # Use the monzo_account to retrieve the pot balance
-        new_baseline = monzo_account.get_pot_balance(account.pot_id)
-        account.prev_balance = new_baseline
-        account = account_repository.update_credit_account_fields(account.type, account.pot_id, new_baseline, None)
+    # Use the monzo_account to retrieve the pot balance, then persist all baselines at once
+    baselines = {
+        account.type: monzo_account.get_pot_balance(account.pot_id)
+        for account in credit_accounts
+    }
+    account_repository.clear_cooldowns(baselines)
     flash("Cooldown cleared—baseline updated for selected account(s).")
     return redirect(url_for("settings.index"))
\ No newline at end of file
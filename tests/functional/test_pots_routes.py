@@ -1,5 +1,9 @@
+from time import time
 from urllib.parse import urlparse
 
+from app.extensions import db
+from app.models.account_repository import SqlAlchemyAccountRepository
+
 def test_get_pots(test_client, requests_mock, seed_data):
     requests_mock.get(
         "https://api.monzo.com/accounts",
@@ -47,4 +51,26 @@ def test_post_pots(test_client, requests_mock, seed_data):
     assert response.status_code == 200
     assert b"Pot 1" in response.data
     # Verify that the designated pot indicator appears as expected
-    assert b"Credit Card pot" in response.data
\ No newline at end of file
+    assert b"Credit Card pot" in response.data
+
+def test_get_pots_shows_active_cooldown(test_client, requests_mock, seed_data):
+    account_repository = SqlAlchemyAccountRepository(db)
+    account_repository.update_credit_account_fields("American Express", "pot_id", 100, int(time()) + 3600)
+
+    requests_mock.get(
+        "https://api.monzo.com/accounts",
+        json={"accounts": [{"id": "acc_123", "type": "uk_retail", "currency": "GBP"}]},
+    )
+    requests_mock.get(
+        "https://api.monzo.com/pots?current_account_id=acc_123",
+        json={
+            "pots": [
+                {"id": "pot_id", "name": "Card Pot", "balance": 100, "deleted": False},
+                {"id": "pot_456", "name": "Other Pot", "balance": 100, "deleted": False},
+            ]
+        },
+    )
+    response = test_client.get("/pots/")
+    assert response.status_code == 200
+    assert response.data.count(b"Countdown Timer Active Until") == 1
+
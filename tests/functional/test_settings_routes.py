@@ -1,6 +1,10 @@
+from time import time
 from flask import url_for
 from urllib.parse import urlparse
 
+from app.extensions import db
+from app.models.account_repository import SqlAlchemyAccountRepository
+
 def test_settings_get(test_client, seed_data):
     response = test_client.get("/settings/")
     assert response.status_code == 200
@@ -55,7 +59,7 @@ def test_settings_save_success(test_client, monkeypatch):
     monkeypatch.setattr("app.web.settings.repository.get_all", lambda: [type("S", (), s) for s in [
         {"key": k, "value": v} for k, v in dummy_settings.items()
     ]])
-    monkeypatch.setattr("app.web.settings.repository.save", lambda setting: None)
+    monkeypatch.setattr("app.web.settings.repository.save_all", lambda settings: None)
     monkeypatch.setattr("app.web.settings.scheduler.modify_job", lambda **kwargs: None)
     form_data = {
         "monzo_client_id": "id_new",
@@ -91,4 +95,24 @@ def test_settings_save_error(test_client, monkeypatch):
     response = test_client.post(url, data={}, follow_redirects=True)
     assert response.status_code == 200
     # The flashed message should indicate an error saving settings.
-    assert b"Error saving settings" in response.data
\ No newline at end of file
+    assert b"Error saving settings" in response.data
+
+def test_clear_cooldown_resets_baseline(test_client, requests_mock, seed_data):
+    account_repository = SqlAlchemyAccountRepository(db)
+    account_repository.update_credit_account_fields("American Express", "pot_id", 500, int(time()) + 3600)
+
+    requests_mock.get(
+        "https://api.monzo.com/accounts",
+        json={"accounts": [{"id": "acc_123", "type": "uk_retail", "currency": "GBP"}]},
+    )
+    requests_mock.get(
+        "https://api.monzo.com/pots?current_account_id=acc_123",
+        json={"pots": [{"id": "pot_id", "balance": 1500, "deleted": False}]},
+    )
+    response = test_client.post("/settings/clear_cooldown", data={"account_type": "American Express"})
+    assert response.status_code == 302
+
+    account = account_repository.get("American Express")
+    assert account.cooldown_until is None
+    assert account.prev_balance == 1500
+
@@ -31,6 +31,17 @@ def test_new_truelayer_account():
     assert account.token_expiry == 1000
     assert account.pot_id == "pot"
 
+def test_accounts_share_auth_provider_instances():
+    first = TrueLayerAccount("American Express", "access_token", "refresh_token", 1000, "pot")
+    second = TrueLayerAccount("American Express", "access_token", "refresh_token", 1000, "pot")
+    barclaycard = TrueLayerAccount("Barclaycard", "access_token", "refresh_token", 1000, "pot")
+    assert first.auth_provider is second.auth_provider
+    assert barclaycard.auth_provider is not first.auth_provider
+    assert barclaycard.auth_provider.icon_name == "barclaycard.svg"
+
+    monzo = MonzoAccount("access_token", "refresh_token", 1000, "pot")
+    assert monzo.auth_provider is MonzoAccount("access_token", "refresh_token", 1000).auth_provider
+
 def test_is_token_within_expiry_window_true():
     account = TrueLayerAccount("American Express", "access_token", "refresh_token", time() + 1)
     assert account.is_token_within_expiry_window()
@@ -59,6 +70,14 @@ def test_monzo_account_get_account_id(requests_mock):
     account = MonzoAccount("access_token", "refresh_token", int(time()) + 1000)
     assert account.get_account_id() == "id"
 
+def test_monzo_account_fetches_account_list_once(requests_mock):
+    response = {"accounts": [{"id": "id", "type": "uk_retail", "currency": "GBP"}]}
+    accounts_mock = requests_mock.get("https://api.monzo.com/accounts", status_code=200, json=response)
+    account = MonzoAccount("access_token", "refresh_token", int(time()) + 1000)
+    assert account.get_account_id() == "id"
+    assert account.get_authorized_accounts() == response["accounts"]
+    assert accounts_mock.call_count == 1
+
 
 def test_monzo_account_get_pots_joint_account(requests_mock):
     # When testing for joint accounts, update mocked response to include the joint type.
@@ -231,6 +250,23 @@ def test_truelayer_account_get_total_balance(requests_mock):
     # Assert that the total balance is calculated correctly
     assert account.get_total_balance() == 140000  # Total in pence (multiplied by 100)
 
+def test_truelayer_account_get_total_balance_cached_skips_api(requests_mock):
+    cards_mock = requests_mock.get(
+        "https://api.truelayer.com/data/v1/cards",
+        status_code=200,
+        json={"results": [{"account_id": "1", "provider": {"display_name": "VISA"}}]},
+    )
+    requests_mock.get(
+        "https://api.truelayer.com/data/v1/cards/1/balance",
+        status_code=200,
+        json={"results": [{"account_id": "1", "current": 500}]},
+    )
+    account = TrueLayerAccount("Barclaycard", "access_token", "refresh_token", time() + 1000)
+
+    assert account.get_total_balance(force_refresh=True) == 50000
+    assert account.get_total_balance() == 50000
+    assert cards_mock.call_count == 1
+
 def test_monzo_account_refresh_access_token_success(monkeypatch, requests_mock):
     """
     Simulate successful token refresh with the MonzoAuthProvider.
@@ -0,0 +1,44 @@
+import io
+import logging
+from logging.handlers import QueueHandler
+
+from app import configure_logging, create_app
+
+
+def test_create_app_precompiles_templates():
+    app = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": "sqlite://",
+            "SECRET_KEY": "testing",
+            "PRECOMPILE_TEMPLATES": True,
+        }
+    )
+    cached = {name for _, name in app.jinja_env.cache.keys()}
+    templates = app.jinja_env.list_templates()
+    assert templates
+    assert set(templates) <= cached
+
+
+def test_configure_logging_routes_records_through_queue(monkeypatch, mocker):
+    root_logger = logging.getLogger()
+    original_handlers = root_logger.handlers[:]
+    original_level = root_logger.level
+    stream = io.StringIO()
+    # StreamHandler binds sys.stderr when it is created inside configure_logging
+    monkeypatch.setattr("sys.stderr", stream)
+    register = mocker.patch("app.atexit.register")
+    root_logger.handlers.clear()
+    try:
+        configure_logging()
+        assert len(root_logger.handlers) == 1
+        assert isinstance(root_logger.handlers[0], QueueHandler)
+
+        logging.getLogger("test").info("queued message")
+        # Stopping the listener drains the queue before it returns
+        stop_listener = register.call_args.args[0]
+        stop_listener()
+        assert "INFO:test:queued message" in stream.getvalue()
+    finally:
+        root_logger.handlers[:] = original_handlers
+        root_logger.setLevel(original_level)
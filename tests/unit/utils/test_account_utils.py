@@ -0,0 +1,6 @@
+from app.utils.account_utils import get_cooldowns_for_pots
+
+def test_get_cooldowns_for_pots_without_pots_skips_query(mocker):
+    session = mocker.Mock()
+    assert get_cooldowns_for_pots([], session) == {}
+    session.query.assert_not_called()